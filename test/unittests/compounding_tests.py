@@ -13,7 +13,8 @@
 from unittest.case import TestCase
 
 from yieldcurves.compounding import periodic_compounding, periodic_rate, \
-    continuous_compounding, continuous_rate, simple_compounding, simple_rate
+    continuous_compounding, continuous_rate, simple_compounding, \
+    simple_rate, compounding_factor, compounding_rate
 
 
 class CompoundingUnitTests(TestCase):
@@ -43,3 +44,26 @@ class CompoundingUnitTests(TestCase):
                 factor = 0.5
                 rate = periodic_rate(factor, t, p)
                 self.assertAlmostEqual(periodic_compounding(rate, t, p), factor)
+
+    def test_list(self):
+        rates, times = [0.01, 0.02, 0.03], [0.5, 1.0, 5.0]
+        for p in (None, 0, 1, 4):
+            factors = compounding_factor(rates, times, p)
+            self.assertEqual(
+                [compounding_factor(r, t, p) for r, t in zip(rates, times)],
+                factors)
+            self.assertEqual(
+                [compounding_factor(0.01, t, p) for t in times],
+                compounding_factor(0.01, times, p))
+            result = compounding_rate(factors, times, p)
+            for a, b in zip(rates, result):
+                self.assertAlmostEqual(a, b)
+        self.assertEqual(
+            tuple(continuous_compounding(r, 1.) for r in rates),
+            continuous_compounding(tuple(rates), 1.))
+        self.assertEqual(
+            continuous_compounding(0.01, 1.0),
+            continuous_compounding(rate_value=0.01, maturity_value=1.0))
+        self.assertEqual(
+            [compounding_rate(f, t, 4) for f, t in zip(factors, times)],
+            compounding_rate(df=factors, period_fraction=times, frequency=4))
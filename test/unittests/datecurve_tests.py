@@ -1,9 +1,11 @@
+from pickle import dumps, loads
 from unittest import TestCase
 
 from businessdate import BusinessRange, BusinessDate
 from businessdate import daycount as dcc
 
-from yieldcurves import AlgebraCurve, DateCurve
+from yieldcurves import AlgebraCurve, DateCurve, YieldCurve
+from yieldcurves.dcfcurves import DcfCurve
 from yieldcurves.interpolation import linear
 from yieldcurves.tools import lin
 
@@ -103,6 +105,50 @@ class DateCurveUnitTests(TestCase):
         d[0.15] = 0
         self.assertEqual(d(2), 0)
 
+    def test_float_inverse(self):
+        d = DateCurve(AlgebraCurve(), origin=0.)
+        for y in (0., 0.25, 1., 2.5, 10.):
+            self.assertAlmostEqual(y, d._inverse(y), delta=1 / DAYS_IN_YEAR)
+        y = [0.25, 1., 2.5]
+        self.assertEqual([d.inverse(_) for _ in y], d.inverse(y))
+
+    def test_cache_size(self):
+        class SmallCacheCurve(DateCurve):
+            CACHE_SIZE = 8
+
+        d = SmallCacheCurve(AlgebraCurve(), origin=1.5)
+        for x in lin(0., 10., 0.1):
+            self.assertEqual(x - 1.5, d(x))
+        self.assertNotIn(d._cache_key, d._yf_cache)
+        self.assertEqual(8, len(d._cache[d._cache_key]))
+
+        origin = BusinessDate(20000101)
+        d = SmallCacheCurve(AlgebraCurve(), origin=origin)
+        for x in BusinessRange(origin, '1y', '1w'):
+            d(x)
+        info = d._yf_cache[d._cache_key].cache_info()
+        self.assertEqual(8, info.currsize)
+        self.assertEqual(8, len(d._cache[d._cache_key]))
+
+        for i in range(100):
+            SmallCacheCurve(AlgebraCurve(), origin=origin + f'{i}d')(origin)
+        self.assertGreaterEqual(DateCurve.CACHE_KEYS, len(DateCurve._cache))
+        self.assertGreaterEqual(
+            DateCurve.CACHE_KEYS, len(DateCurve._yf_cache))
+
+    def test_unhashable_yf(self):
+        class YearFraction:
+            __hash__ = None
+
+            def __call__(self, start, end):
+                return day_count(start, end)
+
+        origin = BusinessDate(20240630)
+        d = DateCurve(AlgebraCurve(), origin=origin, yf=YearFraction())
+        x = origin + '1y'
+        self.assertEqual(day_count(origin, x), d(x))
+        self.assertEqual(x, d.inverse(d.year_fraction(x)))
+
     def test_date(self):
         c = linear([0, 1], [10, 0])
         origin = BusinessDate()
@@ -144,3 +190,30 @@ class DateCurveUnitTests(TestCase):
         c = linear([0.0, 0.25, 0.75, 1.0], [10.0, 7.0, 3.0, 0.0])
         self.assertAlmostEqual(d._curve.x_list, c.x_list)
         self.assertAlmostEqual(d._curve.y_list, c.y_list)
+
+    def test_dcf(self):
+        origin = BusinessDate(20240630)
+        c = YieldCurve(linear([0, 10], [0.01, 0.02]))
+        d = DcfCurve(c, origin=origin)
+        dates = [origin + '1y', origin + '2y', origin + '5y']
+        y = d.year_fraction(dates)
+        self.assertEqual(c.df(0, y), d.get_discount_factor(origin, dates))
+        self.assertEqual(c.zero(0, y), d.get_zero_rate(origin, dates))
+        self.assertEqual(c.annuity(y), d.get_swap_annuity(dates))
+        start, stop = dates[:-1], dates[1:]
+        self.assertEqual([d.get_zero_rate(s, e) for s, e in zip(start, stop)],
+                         d.get_zero_rate(start, stop))
+        for x, t in zip(dates, y):
+            self.assertEqual(c.df(t), d.get_discount_factor(x))
+            self.assertEqual(c.prob(t), d.get_survival_prob(x))
+            self.assertEqual(c.hz(t), d.get_hazard_rate(x))
+            self.assertEqual(c.cash(t), d.get_cash_rate(x))
+
+    def test_pickle(self):
+        c = YieldCurve(linear([0, 10], [0.01, 0.02]))
+        for cls in DateCurve, DcfCurve:
+            d = cls(c, origin=0.)
+            self.assertFalse(type(d).__dictoffset__)
+            e = loads(dumps(d))
+            self.assertEqual(repr(d), repr(e))
+            self.assertEqual(d(5.), e(5.))
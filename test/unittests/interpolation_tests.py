@@ -37,6 +37,17 @@ class InterpolationUnitTests(TestCase):
             for s in self.s:
                 self.assertAlmostEqual(f(x + s), self.a + self.b * (x + s))
 
+    def test_setitem_delitem_refresh(self):
+        f = linear(self.x, self.y)
+        f[4.] = 0.04
+        self.assertEqual(self.x + [4.], f.x_list)
+        self.assertAlmostEqual(f(3.5), 0.035)
+        del f[4.]
+        f[2.5] = 0.
+        self.assertEqual([1., 2., 2.5, 3.], f.x_list)
+        self.assertAlmostEqual(f(2.5), 0.)
+        self.assertAlmostEqual(f(4.), 0.09)
+
     def test_no(self):
         f = no(self.x, self.y)
         for x, y in zip(self.x, self.y):
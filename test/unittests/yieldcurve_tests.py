@@ -1,6 +1,8 @@
+from math import log
+from pickle import dumps, loads
 from unittest import TestCase
 
-from yieldcurves import AlgebraCurve, YieldCurve
+from yieldcurves import AlgebraCurve, YieldCurve, Df, init
 from yieldcurves.interpolation import linear
 from yieldcurves.models import NelsonSiegelSvensson
 from yieldcurves.tools import lin
@@ -42,6 +44,72 @@ class YieldCurveTests(TestCase):
         for x in lin(0.05, 20.05, 0.05):
             self.assertAlmostEqual(a(x), b(x))
 
+    def test_nested_curve(self):
+        a = YieldCurve(self.nss)
+        b = YieldCurve(YieldCurve.from_spot_rates(a), spot_price=2.)
+        for x in lin(0.05, 20.05, 0.05):
+            self.assertEqual(a(x), b(x))
+            self.assertAlmostEqual(2 * a.price(x), b.price(x))
+
+    def test_pickle(self):
+        for f in (YieldCurve(self.nss, spot_price=2.),
+                  YieldCurve.from_zero_rates(0.02, frequency=4),
+                  YieldCurve.from_short_rates(linear([0, 10], [0.01, 0.02]))):
+            self.assertFalse(type(f).__dictoffset__)
+            g = loads(dumps(f))
+            self.assertEqual(repr(f), repr(g))
+            self.assertEqual(f.price(5), g.price(5))
+
+    def test_reversed_swap(self):
+        f = YieldCurve(linear([0, 10], [0.01, 0.02]))
+        df = f.df(5., 2.)
+        self.assertAlmostEqual(df * (2. - 5.), f.annuity(5., 2.))
+        self.assertAlmostEqual((1. - df) / (df * (2. - 5.)), f.swap(5., 2.))
+
+    def test_df_swap(self):
+        f = YieldCurve.from_df(linear([0, 10], [0.99, 0.8]))
+        for x in (0.3, 5.):
+            df = f.df(x)  # swap takes df override of from_df
+            self.assertAlmostEqual((1. - df) / f.annuity(x), f.swap(x))
+
+    def test_replace_curve(self):
+        f = YieldCurve(self.nss)
+        g = YieldCurve(f)
+        f.curve = linear([0, 10], [0.02, 0.02])
+        self.assertEqual(0.02, f(5.))
+        self.assertEqual(0.02, g(5.))
+        self.assertEqual(0.02, f.short(5.))
+        self.assertEqual(0.02, g.short(5.))
+
+    def test_shared_constant(self):
+        a, b = init(0.02), init(0.02)
+        self.assertIs(a, b)
+        with self.assertRaises(AttributeError):
+            a.curve = 0.03
+        self.assertEqual(0.02, b(1.))
+        self.assertEqual(0.02, loads(dumps(a)).curve)
+
+    def test_operator_curve(self):
+        df = Df(YieldCurve(0.01))
+        self.assertEqual(YieldCurve(0.01).df(2.), df(2.))
+        df.curve = YieldCurve(0.05)
+        self.assertEqual(YieldCurve(0.05).df(2.), df(2.))
+
+    def test_forward_spot(self):
+        f = YieldCurve(self.nss)
+        for x in lin(0.05, 20.05, 0.05):
+            y = x + 0.25
+            r = -log(f.df(x, y)) / (y - x)
+            self.assertAlmostEqual(r, f.spot(x, y), places=12)
+            self.assertEqual(f.short(x), f.spot(x, x))
+
+    def test_analytic_short(self):
+        a = YieldCurve(self.nss)
+        b = YieldCurve(AlgebraCurve(self.nss))
+        for x in lin(0.05, 20.05, 0.05):
+            self.assertEqual(self.nss.short(x), a.short(x))
+            self.assertAlmostEqual(a.short(x), b.short(x), places=6)
+
     def _test_yield_curve(self, f, places=7):
         a = YieldCurve.from_prices(f.price)
         b = YieldCurve.from_short_rates(f.short)
@@ -84,6 +152,22 @@ class YieldCurveTests(TestCase):
             for g in y:
                 self.assertAlmostEqual(f(x), g(x), places=places, msg=g)
 
+    def test_origin(self):
+        f = YieldCurve(self.nss)
+        y = (YieldCurve.from_prices(f.price), YieldCurve.from_df(f.df),
+             YieldCurve.from_probs(f.prob), YieldCurve.from_pd(f.pd),
+             YieldCurve.from_hazard_rates(f.hz))
+        for g in y:
+            self.assertAlmostEqual(f.short(0), g(0), places=6, msg=g)
+
+    def test_cash_rate_stub(self):
+        f = YieldCurve(linear([0, 10], [0.01, 0.03]), cash_frequency=4)
+        g = YieldCurve.from_cash_rates(f.cash, frequency=f.cash_frequency)
+        for x in (0.3, 1.1, 5.6, 9.9):
+            self.assertAlmostEqual(f(x), g(x), places=3)
+            self.assertEqual(g.curve(x), g.cash(x, x + 0.25))
+            self.assertAlmostEqual(f.cash(x, x + 1), g.cash(x, x + 1), 3)
+
     def test_interest_rate_curve(self):
         f = YieldCurve(0.02,
                        compounding_frequency=4,
@@ -110,6 +194,8 @@ class YieldCurveTests(TestCase):
         for x in lin(0.05, 20.05, 0.05):
             for g in y:
                 self.assertAlmostEqual(f(x), g(x), places=places, msg=g)
+            for g in a, d:
+                self.assertAlmostEqual(f.hz(x), g.hz(x), places=6, msg=g)
 
     def _test_marginal_credit_curve(self, f, places=7):
         a = YieldCurve.from_marginal_probs(f.marginal)
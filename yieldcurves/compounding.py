@@ -10,11 +10,63 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+from functools import wraps
+from inspect import signature as _signature
+from itertools import repeat
 from math import exp, log, pow
-from vectorizeit import vectorize
 
+from .tools import ITERABLE
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+
+def _zipped(func):
+    """maps **func** over lists of first and second argument in parallel
+
+    a scalar first or second argument is repeated to match the other list
+    and the result is of the same type as the first list argument given
+    """
+    signature = _signature(func)
+
+    @wraps(func)
+    def zipped(*args, **kwargs):
+        if kwargs or len(args) < 2:
+            # keep keyword arguments by their public parameter names
+            bound = signature.bind(*args, **kwargs)
+            args, kwargs = bound.args, bound.kwargs
+        x, y, *args = args
+        if isinstance(x, ITERABLE):
+            cls = type(x)
+            y = y if isinstance(y, ITERABLE) else repeat(y)
+        elif isinstance(y, ITERABLE):
+            cls = type(y)
+            x = repeat(x)
+        else:
+            return func(x, y, *args, **kwargs)
+        return cls(func(a, b, *args, **kwargs) for a, b in zip(x, y))
+    return zipped
+
+
+def _compounding_factor(rate_value, maturity_value, frequency=None):
+    """scalar kernel of |compounding_factor()|"""
+    maturity_value = float(maturity_value)
+    if frequency is None or frequency < 0:
+        return exp(-1.0 * rate_value * maturity_value)
+    if frequency == 0:
+        return 1.0 / (1.0 + rate_value * maturity_value)
+    ex = -frequency * maturity_value
+    return pow(1.0 + float(rate_value) / frequency, ex)
+
+
+def _compounding_rate(df, period_fraction, frequency=None):
+    """scalar kernel of |compounding_rate()|"""
+    period_fraction = float(period_fraction)
+    if frequency is None or frequency < 0:
+        return -log(df) / period_fraction
+    if frequency == 0:
+        return (1.0 / df - 1.0) / period_fraction
+    return (pow(df, -1.0 / (period_fraction * frequency)) - 1.0) * frequency
+
+
+@_zipped
 def simple_compounding(rate_value, maturity_value):
     r"""simple compounded discount factor
 
@@ -25,7 +77,7 @@ def simple_compounding(rate_value, maturity_value):
     return 1.0 / (1.0 + rate_value * float(maturity_value))
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def simple_rate(df, period_fraction):
     r"""interest rate from simple compounded dicount factor
 
@@ -36,7 +88,7 @@ def simple_rate(df, period_fraction):
     return (1.0 / df - 1.0) / float(period_fraction)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def continuous_compounding(rate_value, maturity_value):
     r"""continuous compounded discount factor
 
@@ -47,7 +99,7 @@ def continuous_compounding(rate_value, maturity_value):
     return exp(-1.0 * rate_value * float(maturity_value))
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def continuous_rate(df, period_fraction):
     r"""interest rate from continuous compounded dicount factor
 
@@ -55,12 +107,10 @@ def continuous_rate(df, period_fraction):
     :param period_fraction: interest rate period $\tau$
     :return: $-\log(df)\cdot \frac{1}{\tau}$
     """
-    if not df:
-        pass
     return -log(df) / float(period_fraction)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def periodic_compounding(rate_value, maturity_value, frequency):
     r"""periodically compounded discount factor
 
@@ -69,16 +119,10 @@ def periodic_compounding(rate_value, maturity_value, frequency):
     :param frequency: number of interest rate periods $m$
     :return: $(1+\frac{r}{m})^{-\tau\cdot m}$
     """
-    if frequency is None:
-        return continuous_compounding(rate_value, maturity_value)
-    if frequency == 0:
-        return simple_compounding(rate_value, maturity_value)
-
-    ex = -frequency * float(maturity_value)
-    return pow(1.0 + float(rate_value) / frequency, ex)
+    return _compounding_factor(rate_value, maturity_value, frequency)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def periodic_rate(df, period_fraction, frequency):
     r"""interest rate from continuous compounded discount factor
 
@@ -87,11 +131,10 @@ def periodic_rate(df, period_fraction, frequency):
     :param frequency: number of interest rate periods $m$
     :return: $(df^{-\frac{1}{\tau\cdot m}}-1) \cdot m$
     """
-    period_fraction = float(period_fraction)
-    return (pow(df, -1.0 / (period_fraction * frequency)) - 1.0) * frequency
+    return _compounding_rate(df, period_fraction, frequency)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def annually_compounding(rate_value, maturity_value):
     r"""annually compounded discount factor
 
@@ -99,10 +142,10 @@ def annually_compounding(rate_value, maturity_value):
     :param maturity_value: loan maturity $\tau$
     :return: $(1+r)^{-\tau}$
     """
-    return periodic_compounding(rate_value, maturity_value, 1)
+    return _compounding_factor(rate_value, maturity_value, 1)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def semi_compounding(rate_value, maturity_value):
     r"""semi compounded discount factor
 
@@ -110,10 +153,10 @@ def semi_compounding(rate_value, maturity_value):
     :param maturity_value: loan maturity $\tau$
     :return: $(1+\frac{r}{2})^{-\tau\cdot 2}$
     """
-    return periodic_compounding(rate_value, maturity_value, 2)
+    return _compounding_factor(rate_value, maturity_value, 2)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def quarterly_compounding(rate_value, maturity_value):
     r"""quarterly compounded discount factor
 
@@ -121,10 +164,10 @@ def quarterly_compounding(rate_value, maturity_value):
     :param maturity_value: loan maturity $\tau$
     :return: $(1+\frac{r}{4})^{-\tau\cdot 4}$
     """
-    return periodic_compounding(rate_value, maturity_value, 4)
+    return _compounding_factor(rate_value, maturity_value, 4)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def monthly_compounding(rate_value, maturity_value):
     r"""monthly compounded discount factor
 
@@ -132,10 +175,10 @@ def monthly_compounding(rate_value, maturity_value):
     :param maturity_value: loan maturity $\tau$
     :return: $(1+\frac{r}{12})^{-\tau\cdot 12}$
     """
-    return periodic_compounding(rate_value, maturity_value, 12)
+    return _compounding_factor(rate_value, maturity_value, 12)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def daily_compounding(rate_value, maturity_value):
     r"""daily compounded discount factor
 
@@ -143,10 +186,10 @@ def daily_compounding(rate_value, maturity_value):
     :param maturity_value: loan maturity $\tau$
     :return: $(1+\frac{r}{365})^{-\tau\cdot 365}$
     """
-    return periodic_compounding(rate_value, maturity_value, 365)
+    return _compounding_factor(rate_value, maturity_value, 365)
 
 
-@vectorize(['rate_value', 'maturity_value'], zipped=True)
+@_zipped
 def compounding_factor(rate_value, maturity_value, frequency=None):
     r"""compounded discount factor
 
@@ -158,14 +201,10 @@ def compounding_factor(rate_value, maturity_value, frequency=None):
         and if **period_value** is **0** |simple_compounding()| is used.
     :return:
     """
-    if frequency is None or frequency < 0:
-        return continuous_compounding(rate_value, maturity_value)
-    if frequency == 0:
-        return simple_compounding(rate_value, maturity_value)
-    return periodic_compounding(rate_value, maturity_value, frequency)
+    return _compounding_factor(rate_value, maturity_value, frequency)
 
 
-@vectorize(['df', 'period_fraction'], zipped=True)
+@_zipped
 def compounding_rate(df, period_fraction, frequency):
     r"""interest rate from compounded discount factor
 
@@ -176,11 +215,7 @@ def compounding_rate(df, period_fraction, frequency):
         if **frequency** is **None** |continuous_rate()| is used
         and if **frequency** is **0** |simple_rate()| is used.
     """
-    if frequency is None or frequency < 0:
-        return continuous_rate(df, period_fraction)
-    if frequency == 0:
-        return simple_rate(df, period_fraction)
-    return periodic_rate(df, period_fraction, frequency)
+    return _compounding_rate(df, period_fraction, frequency)
 
 
 def validate_compounding_pair(rate, factor):
@@ -11,20 +11,32 @@
 
 
 from datetime import timedelta, date
+from functools import lru_cache
 
 from prettyclass import prettyclass
 
 from . import interpolation as _interpolation
-from .tools import ITERABLE
+from .tools import ITERABLE, slot_state
 from .yieldcurves import YieldCurve
 
 
-@prettyclass
+def _bounded_set(cache, key, value, size):
+    # drop oldest entry (dicts keep insertion order) to bound cache size
+    if key not in cache and size <= len(cache):
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+@prettyclass(init=False)
 class DateCurve:
+    __slots__ = 'curve', 'origin', 'yf'
     BASEDATE = date.today()
     DAYS_IN_YEAR = 365.25
     INTERPOLATION = 'linear'
+    CACHE_SIZE = 4096  # max number of cached dates per origin and yf
+    CACHE_KEYS = 64  # max number of cached pairs of origin and yf
     _cache = {}
+    _yf_cache = {}
 
     def __init__(self, curve, *, origin=None, yf=None):
         """Curve class with date type arguments
@@ -66,11 +78,13 @@ class DateCurve:
             origin = self._parse_date(origin)
         self.origin = origin
         self.yf = yf
-        self._cache[self._cache_key] = self._cache.get(self._cache_key, {})
 
     def __bool__(self):
         return bool(self.curve)
 
+    def __getstate__(self):
+        return slot_state(self)
+
     def _parse_date(self, d):
         if d is None:
             return
@@ -88,9 +102,21 @@ class DateCurve:
             d = (d,)
         return t(*d)
 
+    def _inverse_cache(self):
+        key = self._cache_key
+        try:
+            cache = self._cache.get(key)
+        except TypeError:
+            return {}  # unhashable origin or yf, so no caching
+        if cache is None:
+            cache = {}
+            _bounded_set(self._cache, key, cache, self.CACHE_KEYS)
+        return cache
+
     @property
     def _cache_key(self):
-        return f"{self.origin} * {self.yf}"
+        origin = self.BASEDATE if self.origin is None else self.origin
+        return origin, self.yf
 
     @staticmethod
     def dyf(start, end):
@@ -182,16 +208,36 @@ class DateCurve:
         """
         if x is None:
             return None
-        if isinstance(x, ITERABLE):
-            return type(x)(self.year_fraction(_) for _ in x)
-        origin = self.BASEDATE if self.origin is None else self.origin
-        yf = self.yf or self.dyf
+        # resolve origin, yf and caches only once, even for lists of dates
+        key = origin, yf = self._cache_key
+        yf = yf or self.dyf
         date_type = type(origin)
-        if not isinstance(x, date_type):
-            x = date_type(x)
-        y = yf(origin, x)
-        self._cache[self._cache_key][y] = x
-        return y
+        size = self.CACHE_SIZE
+        if date_type is float:
+            # year fractions of floats are cheap, so do not cache them
+            cached = yf
+        else:
+            try:
+                cached = self._yf_cache.get(key)
+            except TypeError:
+                cached = yf  # unhashable origin or yf, so no caching
+            else:
+                if cached is None:
+                    # year fractions are pure for given origin and yf
+                    cached = lru_cache(size)(yf)
+                    _bounded_set(self._yf_cache, key, cached, self.CACHE_KEYS)
+        inverse = self._inverse_cache()
+
+        def _year_fraction(d):
+            if not isinstance(d, date_type):
+                d = date_type(d)
+            y = cached(origin, d)
+            _bounded_set(inverse, y, d, size)
+            return y
+
+        if isinstance(x, ITERABLE):
+            return type(x)(map(_year_fraction, x))
+        return _year_fraction(x)
 
     def inverse(self, y):
         """inverse function of year fraction function
@@ -245,11 +291,17 @@ class DateCurve:
         BusinessDate(20250101)
 
         """
+        # resolve cache only once, even for lists of year fractions
+        cache = self._inverse_cache()
+
+        def inverse(v):
+            if v not in cache:
+                _bounded_set(cache, v, self._inverse(v), self.CACHE_SIZE)
+            return cache[v]
+
         if isinstance(y, ITERABLE):
-            return type(y)(self.year_fraction(_) for _ in y)
-        if y not in self._cache[self._cache_key]:
-            self._cache[self._cache_key][y] = self._inverse(y)
-        return self._cache[self._cache_key][y]
+            return type(y)(map(inverse, y))
+        return inverse(y)
 
     def _inverse(self, value, step=4096):
         def yf_inv(y, yf, step=1):
@@ -278,7 +330,7 @@ class DateCurve:
             def yf(x):
                 return self.year_fraction(d + x / self.DAYS_IN_YEAR)
 
-            return d + self._yf_inv(value, yf, step=step) / self.DAYS_IN_YEAR
+            return d + yf_inv(value, yf, step=step) / self.DAYS_IN_YEAR
         else:
             def yf(x):
                 return self.year_fraction(d + timedelta(x))
@@ -291,17 +343,22 @@ class DateCurve:
         return self.curve(*_, **__)
 
     def __getattr__(self, item):
-        if hasattr(self.curve, item):
-            def func(*args, **kwargs):
-                args = tuple(self.year_fraction(x) for x in args)
-                kwargs = {k: self.year_fraction(y) for k, y in kwargs.items()}
-                return getattr(self.curve, item)(*args, **kwargs)
-            func.__qualname__ = self.__class__.__qualname__ + '.' + item
-            func.__name__ = item
-            func.__self__ = self
-            return func
-        msg = f"{self.__class__.__name__!r} object has no attribute {item!r}"
-        raise AttributeError(msg)
+        try:
+            # look up only once, since properties may be expensive
+            attr = getattr(self.curve, item)
+        except AttributeError:
+            cls = self.__class__.__name__
+            msg = f"{cls!r} object has no attribute {item!r}"
+            raise AttributeError(msg) from None
+
+        def func(*args, **kwargs):
+            args = tuple(self.year_fraction(x) for x in args)
+            kwargs = {k: self.year_fraction(y) for k, y in kwargs.items()}
+            return attr(*args, **kwargs)
+        func.__qualname__ = self.__class__.__qualname__ + '.' + item
+        func.__name__ = item
+        func.__self__ = self
+        return func
 
     @classmethod
     def from_interpolation(cls, domain, curve, *, origin=None, yf=None,
@@ -346,7 +403,7 @@ class DateCurve:
         0.020497267759562843
 
         >>> yc.spot(today + '6m')
-        0.020497267759562673
+        0.020497267759562843
 
         """  # noqa 501
         self = cls(None, origin=origin, yf=yf)
@@ -15,30 +15,44 @@ from prettyclass import prettyclass
 from .datecurves import DateCurve
 
 
-@prettyclass
+@prettyclass(init=False)
 class DcfCurve(DateCurve):
+    """|DateCurve| with getters of the *dcf* curve api
+
+    Discount factors and zero rates are evaluated for a list of dates
+    at once if such list is given as **stop**
+    or pairwise if lists are given as **start** and **stop**.
+    """
+    __slots__ = ()
 
     def get_discount_factor(self, start, stop=None):
-        return self.curve.df(start, stop)
+        yf = self.year_fraction
+        return self.curve.df(yf(start), yf(stop))
 
     def get_zero_rate(self, start, stop=None):
-        return self.curve.zero(start, stop)
+        yf = self.year_fraction
+        return self.curve.zero(yf(start), yf(stop))
 
     def get_short_rate(self, start):
-        return self.curve.short(start)
+        return self.curve.short(self.year_fraction(start))
 
     def get_cash_rate(self, start, stop=None, step=None):
-        stop = start + step if stop is None else stop
-        return self.curve.cash(start, stop)
+        if stop is None and step is not None:
+            stop = start + step
+        # stop None gives cash rate with default tenor of inner curve
+        yf = self.year_fraction
+        return self.curve.cash(yf(start), yf(stop))
 
     def get_swap_annuity(self, date_list):
-        return self.curve.annuity(date_list)
+        return self.curve.annuity(self.year_fraction(date_list))
 
     def get_survival_prob(self, start, stop=None):
-        return self.curve.prob(start, stop)
+        yf = self.year_fraction
+        return self.curve.prob(yf(start), yf(stop))
 
     def get_flat_intensity(self, start, stop=None):
-        return self.curve.intensity(start, stop)
+        yf = self.year_fraction
+        return self.curve.intensity(yf(start), yf(stop))
 
     def get_hazard_rate(self, start):
-        return self.curve.hz(start)
+        return self.curve.hz(self.year_fraction(start))
@@ -19,6 +19,7 @@ from reprlib import Repr
 
 from prettyclass import prettyclass
 
+from .tools.constant import init
 from .tools.numerics import bisection_method, newton_raphson, secant_method
 
 
@@ -67,6 +68,15 @@ def fit(curve,
         func = globals()[interpolation_type]
     else:
         func = interpolation_type
+    # resolve root finding method once for all grid points
+    if 'newton' in method:
+        root, args = newton_raphson, (sum(bounds) / 2,)
+    elif 'secant' in method:
+        root, args = secant_method, (sum(bounds) / 3, sum(bounds) / 2)
+    elif 'bisec' in method:
+        root, args = bisection_method, tuple(bounds)
+    else:
+        raise ValueError(f"unkown method {method}")
     addon = func(grid, [0.0] * len(grid))
     curve += addon
     for t, f, v in zip(grid, err_func, target_list):
@@ -75,18 +85,7 @@ def fit(curve,
             addon[t] = current
             return f() - v
         # run root finding
-
-        if 'newton' in method:
-            guess = sum(bounds) / 2
-            newton_raphson(err, guess, tolerance)
-        elif 'secant' in method:
-            a, b = sum(bounds) / 3, sum(bounds) / 2
-            secant_method(err, a, b, tolerance)
-        elif 'bisec' in method:
-            a, b = bounds
-            bisection_method(err, a, b, tolerance)
-        else:
-            raise ValueError(f"unkown method {method}")
+        root(err, *args, tolerance)
 
     curve -= addon
     return dict(addon.items())
@@ -106,11 +105,11 @@ class base_interpolation(UserDict):
 
     @property
     def x_list(self):
-        return plist(self.keys())
+        return plist(self._xs)
 
     @property
     def y_list(self):
-        return plist(self.values())
+        return plist(self._ys)
 
     def __init__(self, x_list=(), y_list=()):
         r""" interpolation class
@@ -128,7 +127,11 @@ class base_interpolation(UserDict):
         if isinstance(x_list, dict) and not y_list:
             y_list = x_list.values()
             x_list = x_list.keys()
-        super().__init__(zip(map(float, x_list), map(float, y_list)))
+        super().__init__()
+        # sort all points at once rather than on every single insert
+        self.data = dict(sorted(zip(map(float, x_list), map(float, y_list))))
+        # sorted points and values are kept as parallel tuples
+        self._update()
 
     def __call__(self, x):
         return float(x)
@@ -136,11 +139,19 @@ class base_interpolation(UserDict):
     def __setitem__(self, key, value):
         super().__setitem__(float(key), float(value))
         self.data = dict(sorted(self.data.items()))
+        self._update()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._update()
+
+    def _update(self):
+        self._xs = tuple(self.data)
+        self._ys = tuple(self.data.values())
 
     def _op(self, other, attr):
         new = self.__copy__()
-        if not callable(other):
-            other = constant([0.0], [other])
+        other = init(other)
         for k in new:
             new[k] = getattr(new[k], attr)(other(k))
         return new
@@ -180,7 +191,7 @@ class flat(base_interpolation):
         super(flat, self).__init__([0.0], [y])
 
     def __call__(self, x):
-        return self.y_list[0]
+        return self._ys[0]
 
 
 class identity(base_interpolation):
@@ -218,9 +229,9 @@ class _default_value_interpolation(base_interpolation):
         super().__init__(x_list, y_list)
 
     def __call__(self, x):
-        if x not in self.x_list:
+        if x not in self._xs:
             return self._default
-        return self.y_list[self.x_list.index(x)]
+        return self._ys[self._xs.index(x)]
 
 
 class no(_default_value_interpolation):
@@ -306,14 +317,13 @@ class left(base_interpolation):
         super().__init__(x_list, y_list)
 
     def __call__(self, x):
-        if len(self.y_list) == 0:
+        if len(self._ys) == 0:
             raise OverflowError
-        if x in self.x_list:
-            i = self.x_list.index(x)
-        else:
-            i = bisect_left(self.x_list, float(x), 1,
-                            len(self.x_list)) - 1
-        return self.y_list[i]
+        if len(self._ys) == 1:
+            return self._ys[0]
+        # bisect right also hits given points without a linear scan
+        i = bisect_right(self._xs, float(x), 1, len(self._xs)) - 1
+        return self._ys[i]
 
 
 class constant(left):
@@ -357,14 +367,13 @@ class right(base_interpolation):
         super().__init__(x_list, y_list)
 
     def __call__(self, x):
-        if len(self.y_list) == 0:
+        if len(self._ys) == 0:
             raise OverflowError
-        if x in self.x_list:
-            i = self.x_list.index(x)
-        else:
-            i = bisect_right(self.x_list, float(x), 0,
-                             len(self.x_list) - 1)
-        return self.y_list[i]
+        if len(self._ys) == 1:
+            return self._ys[0]
+        # bisect left also hits given points without a linear scan
+        i = bisect_left(self._xs, float(x), 0, len(self._xs) - 1)
+        return self._ys[i]
 
 
 class nearest(base_interpolation):
@@ -399,18 +408,18 @@ class nearest(base_interpolation):
         super().__init__(x_list, y_list)
 
     def __call__(self, x):
-        if len(self.y_list) == 0:
+        if len(self._ys) == 0:
             raise OverflowError
-        if len(self.y_list) == 1:
-            return self.y_list[0]
-        if x in self.x_list:
-            i = self.x_list.index(x)
+        if len(self._ys) == 1:
+            return self._ys[0]
+        if x in self._xs:
+            i = self._xs.index(x)
         else:
-            i = bisect_left(self.x_list, float(x), 1, len(self.x_list) - 1)
-            if (self.x_list[i - 1] - x) / (self.x_list[i - 1] -
-                                           self.x_list[i]) <= 0.5:
+            i = bisect_left(self._xs, float(x), 1, len(self._xs) - 1)
+            if (self._xs[i - 1] - x) / (self._xs[i - 1] -
+                                        self._xs[i]) <= 0.5:
                 i -= 1
-        return self.y_list[i]
+        return self._ys[i]
 
 
 class linear(base_interpolation):
@@ -444,13 +453,15 @@ class linear(base_interpolation):
         super().__init__(x_list, y_list)
 
     def __call__(self, x):
-        if len(self.y_list) == 0:
+        xs, ys = self._xs, self._ys  # local names save attribute lookups
+        n = len(ys)
+        if n == 0:
             raise OverflowError(f'x_list={self.x_list} y_list={self.y_list}')
-        if len(self.y_list) == 1:
-            return self.y_list[0]
-        i = bisect_left(self.x_list, float(x), 1, len(self.x_list) - 1)
-        return self.y_list[i - 1] + (self.y_list[i] - self.y_list[i - 1]) * \
-            (self.x_list[i - 1] - x) / (self.x_list[i - 1] - self.x_list[i])
+        if n == 1:
+            return ys[0]
+        i = bisect_left(xs, float(x), 1, n - 1)
+        x0, y0 = xs[i - 1], ys[i - 1]
+        return y0 + (ys[i] - y0) * (x0 - x) / (x0 - xs[i])
 
 
 class piecewise_linear(linear):
@@ -499,10 +510,10 @@ class piecewise_linear(linear):
             cls = self.__class__.__name__
             raise ValueError(f"{cls} must contain at least one point")
         x = float(x)
-        if len(self) == 1 or x <= self.x_list[0]:
-            return self.y_list[0]
-        if self.x_list[-1] <= x:
-            return self.y_list[-1]
+        if len(self) == 1 or x <= self._xs[0]:
+            return self._ys[0]
+        if self._xs[-1] <= x:
+            return self._ys[-1]
         return super().__call__(x)
 
 
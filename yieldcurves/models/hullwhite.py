@@ -16,12 +16,22 @@ from random import Random
 
 from prettyclass import prettyclass
 
-from ..compounding import continuous_compounding, continuous_rate
 from ..tools import ITERABLE
 from ..tools.numerics import integrate, Matrix, Identity, cholesky
 from ..tools.constant import init
 
 
+@cache
+def _cholesky_factors(a, b, c):
+    """cholesky factors of 3x3 correlation matrix (cached by values)"""
+    # _corr = [[1, a, b], [a, 1, c], [b, c, 1]]
+    d = sqrt(1 - a ** 2)
+    e = (c - a * b) / d if d else 0.
+    f = sqrt(1 - b ** 2 - e ** 2)
+    # _cholesky = [[1, 0, 0], [a, d, 0], [b, e, f]]
+    return d, e, f
+
+
 @prettyclass
 class _HullWhiteModel:
     """Hull White model in terminal measure from sport rates"""
@@ -93,11 +103,7 @@ class _HullWhiteModel:
         a = self.domestic_correlation
         b = self.fx_correlation
         c = self.domestic_fx_correlation
-        # _corr = [[1, a, b], [a, 1, c], [b, c, 1]]
-        d = sqrt(1 - a ** 2)
-        e = (c - a * b) / d if d else 0.
-        f = sqrt(1 - b ** 2 - e ** 2)
-        # _cholesky = [[1, 0, 0], [a, d, 0], [b, e, f]]
+        d, e, f = _cholesky_factors(a, b, c)
 
         if q is None:
             q0 = self.random.gauss(0., 1.)
@@ -329,11 +335,11 @@ class _HullWhiteCurve(_HullWhiteFactor):
         if not x:
             return self.curve(t)
         x += t  # todo: verify spot shift to t
-        df = continuous_compounding(self.curve(x), x)
-        df /= continuous_compounding(self.curve(t), t)
         b = self.model.calc_integral_b(t, x)
-        a = exp(-0.5 * b ** 2 * self.model.calc_integral_two(0.0, t))
-        return continuous_rate(df * a * exp(-b * self.get(t, 0.)), x)
+        v = 0.5 * b ** 2 * self.model.calc_integral_two(0.0, t)
+        # add up log discount factors rather than exp and log round trip
+        log_df = self.curve(t) * t - self.curve(x) * x
+        return (v + b * self.get(t, 0.) - log_df) / x
 
     def evolve(self, step_size=.25, *, q=None):
         t = self.t
@@ -360,13 +366,24 @@ class _HullWhiteFx(_HullWhiteFactor):
         t = self.t
         return self.curve(t) * exp(self.get(t, 0.))
 
+    def _log_growth(self, x):
+        if self.domestic_curve is self.foreign_curve:
+            # same curve on both legs, e.g. the default zero curves
+            return 0.
+        return (self.foreign_curve(x) - self.domestic_curve(x)) * x
+
     def __call__(self, x, y=None):
         if y is not None:
-            return self(y) / self(x)
+            # spot cancels out, so take a single exponential
+            start = self._log_growth(x)
+            if isinstance(y, ITERABLE):
+                return type(y)(exp(self._log_growth(_) - start) for _ in y)
+            return exp(self._log_growth(y) - start)
         # todo: verify spot shift to t, i.e. implied spot shift here
-        df = continuous_compounding(self.domestic_curve(x), x)
-        df /= continuous_compounding(self.foreign_curve(x), x)
-        return float(self) * df
+        if self.domestic_curve is self.foreign_curve:
+            return float(self)
+        # ratio of discount factors as a single exponential
+        return float(self) * exp(self._log_growth(x))
 
     def evolve(self, step_size=.25, *, q=None):
         t = self.t
@@ -669,13 +686,13 @@ class _HullWhiteGlobal:
         q = [random.gauss(0., 1.) for _ in range(len(self.factors))]
         if c is not None:
             q = list(map(float, c.dot(q)))
-        for i, f in enumerate(self.factors):
-            if isinstance(f, _HullWhiteCurve):
-                f.evolve(step_size, q=q[i])
-            elif isinstance(f, _HullWhiteFx):
-                f.evolve(step_size, q=[q[0], q[i - 1], q[i]])
-            else:
-                raise TypeError(f"cannot evolve {f.__class__.__qualname__}")
+        # factor order (curve, curve, fx, curve, fx, ...) is validated
+        # on construction, so dispatch by position rather than by type
+        factors = self.factors
+        factors[0].evolve(step_size, q=q[0])
+        for i in range(1, len(factors), 2):
+            factors[i].evolve(step_size, q=q[i])
+            factors[i + 1].evolve(step_size, q=[q[0], q[i], q[i + 1]])
 
     def clear(self):
         for f in self.factors:
@@ -13,19 +13,31 @@
 from datetime import date
 from math import exp
 
-import requests
 from vectorizeit import vectorize
 from prettyclass import prettyclass
 
+from ..tools import ITERABLE
 
-"""_params = {
-    'beta0': 1.0138959988,
-    'beta1': 1.836312606,
-    'beta2': 2.9874138836,
-    'beta3': 4.8105550065,
-    'tau1': 0.7389058665,
-    'tau2': 12.0362372437,
-}"""
+
+def _spot_rate(x, beta0, beta1, beta2, beta3, tau1, tau2):
+    """scalar kernel of |spot_rate()|"""
+    x = float(x) or 1e-8
+    t1, t2 = x / tau1, x / tau2
+    e1, e2 = exp(-t1), exp(-t2)
+    a = (1 - e1) / t1
+    b = a - e1
+    c = (1 - e2) / t2 - e2
+    return 0.01 * (beta0 + beta1 * a + beta2 * b + beta3 * c)
+
+
+def _short_rate(x, beta0, beta1, beta2, beta3, tau1, tau2):
+    """scalar kernel of |short_rate()|"""
+    x = float(x) or 1e-8
+    t1, t2 = x / tau1, x / tau2
+    a = exp(-t1)
+    b = a * t1
+    c = exp(-t2) * t2
+    return 0.01 * (beta0 + beta1 * a + beta2 * b + beta3 * c)
 
 
 @vectorize(keys='x')
@@ -51,12 +63,7 @@ def spot_rate(x, *,
              + \beta_3 \left( \frac{1 - e^{-\frac{x}{\tau_2}}}{\frac{x}{\tau_2}} - e^{-\frac{x}{\tau_2}} \right)
 
     """  # noqa 501
-    x = float(x) or 1e-8
-    a = (1 - exp(-x / tau1)) / (x / tau1)
-    b = a - exp(-x / tau1)
-    c = (1 - exp(-x / tau2)) / (x / tau2) - exp(-x / tau2)
-    beta = beta0, beta1, beta2, beta3
-    return 0.01 * sum(b * c for b, c in zip(beta, (1, a, b, c)))
+    return _spot_rate(x, beta0, beta1, beta2, beta3, tau1, tau2)
 
 
 @vectorize(keys='x')
@@ -82,12 +89,7 @@ def short_rate(x, *,
              + \beta_3 \left( e^{-\frac{x}{\tau_2}} \frac{x}{\tau_2} \right)
 
     """
-    x = float(x) or 1e-8
-    a = exp(-x / tau1)
-    b = a * x / tau1
-    c = exp(-x / tau2) * x / tau2
-    beta = beta0, beta1, beta2, beta3
-    return 0.01 * sum(b * c for b, c in zip(beta, (1, a, b, c)))
+    return _short_rate(x, beta0, beta1, beta2, beta3, tau1, tau2)
 
 
 def download_ecb(start='', end='', last=None, aaa_only=True):
@@ -107,6 +109,8 @@ def download_ecb(start='', end='', last=None, aaa_only=True):
     >>> from yieldcurves.models.nelsonsiegel import spot_rate, download_ecb
 
     """
+    import requests  # only needed to download parameters
+
     root = "https://data-api.ecb.europa.eu/service/data/YC/"
     aaa = "B.U2.EUR.4F.G_N_A.SV_C_YM"
     all = "B.U2.EUR.4F.G_N_C.SV_C_YM"
@@ -170,9 +174,6 @@ class NelsonSiegelSvensson:
         self.tau2 = tau2
         self.timestamp = timestamp
 
-    def __call__(self, x):
-        return self.spot(x)
-
     @property
     def __ts__(self):
         return date.fromisoformat(self.timestamp)
@@ -191,10 +192,20 @@ class NelsonSiegelSvensson:
                  + \beta_3 \left( \frac{1 - e^{-\frac{x}{\tau_2}}}{\frac{x}{\tau_2}} - e^{-\frac{x}{\tau_2}} \right)
 
         """  # noqa 501
+        params = (self.beta0, self.beta1, self.beta2, self.beta3,
+                  self.tau1, self.tau2)
+        if isinstance(x, (int, float)):
+            # scalar fast path without vectorize dispatch
+            return _spot_rate(x, *params)
+        if isinstance(x, ITERABLE):
+            # evaluate grid of maturities with parameters bound once
+            return type(x)(_spot_rate(_, *params) for _ in x)
         return spot_rate(x,
                          beta0=self.beta0, beta1=self.beta1, beta2=self.beta2,
                          beta3=self.beta3, tau1=self.tau1, tau2=self.tau2)
 
+    __call__ = spot
+
     def short(self, x):
         r"""short rate (instantaneous spot rate)
 
@@ -209,6 +220,14 @@ class NelsonSiegelSvensson:
                  + \beta_3 \left( e^{-\frac{x}{\tau_2}} \frac{x}{\tau_2} \right)
 
         """  # noqa 501
+        params = (self.beta0, self.beta1, self.beta2, self.beta3,
+                  self.tau1, self.tau2)
+        if isinstance(x, (int, float)):
+            # scalar fast path without vectorize dispatch
+            return _short_rate(x, *params)
+        if isinstance(x, ITERABLE):
+            # evaluate grid of maturities with parameters bound once
+            return type(x)(_short_rate(_, *params) for _ in x)
         return short_rate(x,
                           beta0=self.beta0, beta1=self.beta1, beta2=self.beta2,
                           beta3=self.beta3, tau1=self.tau1, tau2=self.tau2)
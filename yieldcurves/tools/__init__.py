@@ -32,3 +32,15 @@ def snake_case(item, sep='_'):
 def camel_case(item: str, first_lower=False):
     item = "".join(x.capitalize() for x in item.lower().split("_"))
     return item[0].lower() + item[1:] if first_lower else item
+
+
+def slot_state(obj):
+    """attributes of **obj** held in slots as dict, e.g. to pickle"""
+    state = {}
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            try:
+                state[name] = object.__getattribute__(obj, name)
+            except AttributeError:
+                pass  # unset slot
+    return state
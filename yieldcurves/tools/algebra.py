@@ -9,12 +9,10 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
-from math import prod
-
 from vectorizeit import vectorize
 from prettyclass import prettyclass
 
-from .constant import init
+from .constant import constant, init
 
 
 @prettyclass
@@ -53,10 +51,32 @@ class AlgebraCurve:
         else:
             r = self.curve
 
-        r *= prod(m(x) if callable(m) else m for m in self.mul)
-        r /= prod(d(x) if callable(d) else d for d in self.div)
-        r += sum(a(x) if callable(a) else a for a in self.add)
-        r -= sum(s(x) if callable(s) else s for s in self.sub)
+        # plain loops over the (mostly empty) lists avoid a generator each
+        # and constant terms (like spreads) are read without a call
+        if self.mul:
+            m = 1
+            for c in self.mul:
+                m *= c.curve if type(c) is constant \
+                    else c(x) if callable(c) else c
+            r *= m
+        if self.div:
+            d = 1
+            for c in self.div:
+                d *= c.curve if type(c) is constant \
+                    else c(x) if callable(c) else c
+            r /= d
+        if self.add:
+            a = 0
+            for c in self.add:
+                a += c.curve if type(c) is constant \
+                    else c(x) if callable(c) else c
+            r += a
+        if self.sub:
+            s = 0
+            for c in self.sub:
+                s += c.curve if type(c) is constant \
+                    else c(x) if callable(c) else c
+            r -= s
 
         return (self.spread + self.leverage * r) * self.multiplier
 
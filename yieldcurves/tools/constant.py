@@ -10,11 +10,23 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+from functools import lru_cache
+
+
 class constant:
     """constant curve"""
+    __slots__ = 'curve',
 
     def __init__(self, curve=0.0):
-        self.curve = float(curve)
+        object.__setattr__(self, 'curve', float(curve))
+
+    def __setattr__(self, key, value):
+        # immutable, since |init()| shares constant curves of same value
+        msg = f"{self.__class__.__name__!r} object is immutable"
+        raise AttributeError(msg)
+
+    def __reduce__(self):
+        return self.__class__, (self.curve,)
 
     def __call__(self, x):
         return self.curve
@@ -82,6 +94,11 @@ class constant:
         return other % self.curve
 
 
+@lru_cache(maxsize=128)
+def _constant(curve):
+    return constant(curve)
+
+
 def init(curve):
     if callable(curve):
         return curve
@@ -89,4 +106,4 @@ def init(curve):
         cls = curve.__class__.__qualname__
         msg = f"float or callable required but type {cls} given"
         raise TypeError(msg)
-    return constant(curve)
+    return _constant(curve)  # re-use constant curves of same value
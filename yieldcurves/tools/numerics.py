@@ -93,25 +93,29 @@ def trapezoidal_rule(f, a, b, n):
     return integral
 
 
+_NODES = (
+    (0.0, 0.20948214108472782),
+    (-0.20778495500789848, 0.20443294007529889),
+    (0.20778495500789848, 0.20443294007529889),
+    (-0.4058451513773972, 0.19035057806478542),
+    (0.4058451513773972, 0.19035057806478542),
+    (-0.5860872354676911, 0.1690047266392679),
+    (0.5860872354676911, 0.1690047266392679),
+    (-0.7415311855993945, 0.14065325971552592),
+    (0.7415311855993945, 0.14065325971552592),
+    (-0.8648644233597691, 0.10479001032225019),
+    (0.8648644233597691, 0.10479001032225019),
+    (-0.9491079123427585, 0.06309209262997856),
+    (0.9491079123427585, 0.06309209262997856),
+    (-0.9914553711208126, 0.022935322010529224),
+    (0.9914553711208126, 0.022935322010529224),
+)
+
+
 def quadrature(f, a, b):
-    nodes = {0.0: 0.20948214108472782,
-             -0.20778495500789848: 0.20443294007529889,
-             0.20778495500789848: 0.20443294007529889,
-             -0.4058451513773972: 0.19035057806478542,
-             0.4058451513773972: 0.19035057806478542,
-             -0.5860872354676911: 0.1690047266392679,
-             0.5860872354676911: 0.1690047266392679,
-             -0.7415311855993945: 0.14065325971552592,
-             0.7415311855993945: 0.14065325971552592,
-             -0.8648644233597691: 0.10479001032225019,
-             0.8648644233597691: 0.10479001032225019,
-             -0.9491079123427585: 0.06309209262997856,
-             0.9491079123427585: 0.06309209262997856,
-             -0.9914553711208126: 0.022935322010529224,
-             0.9914553711208126: 0.022935322010529224}
     m = 0.5 * (b + a)
     h = 0.5 * (b - a)
-    return sum(w * f(m + h * n) for n, w in nodes.items()) * h
+    return sum(w * f(m + h * n) for n, w in _NODES) * h
 
 
 def integrate(func, a, b):
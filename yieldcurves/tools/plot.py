@@ -9,8 +9,6 @@
 # Website:  https://github.com/sonntagsgesicht/yieldcurves
 # License:  Apache License 2.0 (see LICENSE file)
 
-from matplotlib import use, pyplot as plt
-
 # import matplotlib
 # matplotlib.use('WebAgg')
 # matplotlib.use('TkAgg')
@@ -40,6 +38,8 @@ def lin(start, stop=None, step=None, num=1_000):
 
 def plot(x, *curve, legend=True, figsize=(10, 5), kind='plot', backend=None,
          params=None, show=True, xlim=(), ylim=(), **curves):
+    # import on first plot only, since matplotlib is slow to load
+    from matplotlib import use, pyplot as plt
     if backend:
         use(backend)
     fig, ax = plt.subplots(figsize=figsize)
@@ -73,7 +73,7 @@ class Plotter:
 
     def __init__(self, x, legend=True, figsize=(10, 5), kind='plot',
                  backend=None, params=None, show=True, xlim=(), ylim=()):
-        self.x = lin(x) if isinstance(x, (int, float, slice)) else x
+        self.x = x  # grid is built on first call by plot()
         self.legend = legend
         self.figsize = figsize
         self.kind = kind
@@ -9,17 +9,15 @@
 # Website:  https://github.com/sonntagsgesicht/yieldcurves
 # License:  Apache License 2.0 (see LICENSE file)
 
-from math import prod
-import warnings
+from bisect import bisect_right
+from math import exp, fsum, isclose, log1p, prod
 
 from prettyclass import prettyclass
 
-from .compounding import (simple_rate, simple_compounding, periodic_rate,
-                          periodic_compounding, continuous_compounding,
-                          continuous_rate)
+from .compounding import _compounding_factor, _compounding_rate
 from . import interpolation as _interpolation
 from .interpolation import piecewise_linear, fit
-from .tools import ITERABLE, snake_case
+from .tools import ITERABLE, snake_case, slot_state
 from .tools.numerics import integrate
 from .tools.constant import init
 from .tools.algebra import AlgebraCurve
@@ -31,8 +29,16 @@ SWAP_FREQUENCY = 1
 
 # --- YieldCurveAdapter ---
 
-@prettyclass
+@prettyclass(init=False)
 class _YieldCurveAdapter:
+    __slots__ = ('curve', 'spot_price', 'compounding_frequency',
+                 'cash_frequency', 'swap_frequency')
+    _plain = True  # adapter without own spot rate curve
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # resolve once per class whether __call__ is overridden
+        cls._plain = cls.__call__ is _YieldCurveAdapter.__call__
 
     @classmethod
     def from_interpolation(cls, domain, values,
@@ -57,11 +63,22 @@ class _YieldCurveAdapter:
 
     def __call__(self, x):
         """returns continuous compounding spot rate"""
-        return self.curve(x)
+        # skip plain adapter layers like YieldCurve(YieldCurve(...))
+        # on each call, since any curve attribute may be replaced
+        inner = self.curve
+        while isinstance(inner, _YieldCurveAdapter) and inner._plain:
+            inner = inner.curve
+        return inner(x)
+
+    def __getstate__(self):
+        return slot_state(self)
 
     def __getattr__(self, item):
-        if hasattr(self.curve, item):
+        try:
+            # look up only once, since properties may be expensive
             return getattr(self.curve, item)
+        except AttributeError:
+            pass
         msg = f"{self.__class__.__name__!r} object has no attribute {item!r}"
         raise AttributeError(msg)
 
@@ -71,22 +88,60 @@ class _YieldCurveAdapter:
         """price at x or price factor from x to y"""
         if y is None:
             spot_price = 1 if self.spot_price is None else self.spot_price
-            return float(spot_price) / continuous_compounding(self(x), x)
-        return self.price(y) / self.price(x)
+            spot_price = float(spot_price)
+            if isinstance(x, ITERABLE):
+                # evaluate a whole schedule at once
+                return type(x)(
+                    spot_price / _compounding_factor(self(_), _)
+                    if _ else spot_price for _ in x)
+            if x == 0:
+                # no need to evaluate the curve at origin
+                return spot_price
+            # scalar kernel saves the vectorize dispatch
+            return spot_price / _compounding_factor(self(x), x)
+        # spot price cancels out, so take a single exponential
+        start = self(x) * x if x else 0.
+        if isinstance(y, ITERABLE):
+            # re-use start for a whole schedule
+            return type(y)(exp(self(_) * _ - start) for _ in y)
+        return exp(self(y) * y - start)
 
     def spot(self, x, y=None):
         """spot rate aka. continuous rate aka. yield"""
         if y is None:
             x, y = 0, x
-        df = self.price(x) / self.price(y)
-        return continuous_rate(df, y - x)
+        if isinstance(y, ITERABLE):
+            # re-use start for a whole schedule
+            start = self(x) * x if x else 0.
+            return type(y)((self(_) * _ - start) / (_ - x)
+                           if _ != x else self.short(x) for _ in y)
+        if x == y:
+            # limit of forward rates is the short rate
+            return self.short(x)
+        # log of price ratio without exp and log round trip
+        start = self(x) * x if x else 0.
+        return (self(y) * y - start) / (y - x)
 
     def short(self, x, y=None):
         """short rate aka. instantaneous forward rate"""
-        try:
-            y = min((d for d in self if x < d), default=x + EPS)
-            x = max((d for d in self if d <= x), default=x)
-        except TypeError:
+        if self._plain:
+            # use analytic short rate of current inner spot rate curve
+            inner = self.curve
+            while isinstance(inner, _YieldCurveAdapter) and inner._plain:
+                inner = inner.curve
+            cls = type(inner)
+            if isinstance(inner, _YieldCurveAdapter) or \
+                    getattr(cls, 'spot', None) is cls.__call__:
+                short = getattr(inner, 'short', None)
+                if short is not None:
+                    return short(x)
+        if hasattr(type(self), '__iter__'):
+            # locate enclosing domain interval by bisection
+            domain = sorted(self)
+            i = bisect_right(domain, x)
+            y = domain[i] if i < len(domain) else x + EPS
+            x = domain[i - 1] if i else x
+        else:
             x, y = x - EPS / 2, x + EPS / 2
         return self.spot(x, y)
 
@@ -96,6 +151,14 @@ class _YieldCurveAdapter:
         """continuous compounded discount factor, i.e. 1 / price(x, y)"""
         if y is None:
             x, y = 0, x
+        if isinstance(y, ITERABLE):
+            if isinstance(x, ITERABLE):
+                # discount pairs of start and end dates at once
+                return type(y)(
+                    s / e for s, e in zip(self.price(x), self.price(y)))
+            # discount a whole schedule at once
+            start = self.price(x)
+            return type(y)(start / _ for _ in self.price(y))
         return self.price(x) / self.price(y)
 
     def zero(self, x, y=None):
@@ -105,9 +168,11 @@ class _YieldCurveAdapter:
         if y is None:
             x, y = 0, x
         df = self.df(x, y)
-        if frequency:
-            return periodic_rate(df, y - x, frequency)
-        return continuous_rate(df, y - x)
+        if isinstance(y, ITERABLE):
+            x = x if isinstance(x, ITERABLE) else [x] * len(y)
+            return type(y)(_compounding_rate(d, e - s, frequency or None)
+                           for d, s, e in zip(df, x, y))
+        return _compounding_rate(df, y - x, frequency or None)
 
     def cash(self, x, y=None):
         """simple compound cash rate with tenor **1/cash_frequency**"""
@@ -115,9 +180,13 @@ class _YieldCurveAdapter:
             frequency = self.cash_frequency or \
                         getattr(self.curve, 'cash_frequency', None) or \
                         CASH_FREQUENCY
-            y = x + 1 / float(frequency)
+            tenor = 1 / float(frequency)
+            if isinstance(x, ITERABLE):
+                # resolve tenor only once for a whole schedule of fixings
+                return type(x)(self.cash(_, _ + tenor) for _ in x)
+            y = x + tenor
         df = self.df(x, y)
-        return simple_rate(df, y - x)
+        return _compounding_rate(df, y - x, 0)  # simple compounding
 
     def annuity(self, x, y=None):
         """swap annuity"""
@@ -129,11 +198,15 @@ class _YieldCurveAdapter:
             frequency = self.swap_frequency or \
                 getattr(self.curve, 'swap_frequency', SWAP_FREQUENCY)
             step = 1 / float(frequency)
-            x = [x]
-            while x[-1] + step < y:
-                x.append(x[-1] + step)
+            # number of full coupon periods by integer division
+            n = max(int((y - x) * frequency), 0)
+            x = [x + i * step for i in range(n + 1)]
+            if 1 < len(x) and y - x[-1] < EPS:
+                x.pop()  # avoid degenerated stub period
             x.append(y)
-        return sum(self.df(x[0], e) * (e - s) for s, e in zip(x[:-1], x[1:]))
+        # discount the whole schedule at once
+        df = self.df(x[0], x[1:])
+        return sum(d * (e - s) for s, e, d in zip(x[:-1], x[1:], df))
 
     def swap(self, x, y=None):
         """swap par rate"""
@@ -149,7 +222,8 @@ class _YieldCurveAdapter:
         """survival probability"""
         if y is None:
             x, y = 0, x
-        return self.price(x) / self.price(y)
+        # single price factor instead of two prices and a ratio
+        return 1 / self.price(x, y)
 
     def intensity(self, x, y=None):
         """Poisson process intensity"""
@@ -173,6 +247,7 @@ class _YieldCurveAdapter:
 
 
 class _CompoundingYieldCurveAdapter(_YieldCurveAdapter):
+    __slots__ = 'frequency',
 
     def __init__(self, curve, *, spot_price=None, compounding_frequency=None,
                  cash_frequency=None, swap_frequency=None, frequency=None):
@@ -226,16 +301,24 @@ class YieldCurve(_YieldCurveAdapter):
     >>> yc.price(9)
     118.649074...
 
+    >>> yc.price([0, 9])
+    [100.0, 118.649074...]
+
     forward prices factor $p(t, t') = \frac{p(t')}{p(t)}$
 
     >>> f = yc.price(1, 9)
     >>> 100 * f * yc.price(0, 1)
     118.6490749...
 
+    or for a schedule of dates $t'$ at once
+
+    >>> yc.price(1, [5, 9]) == [yc.price(1, 5), yc.price(1, 9)]
+    True
+
     spot rate $r(t) = f(0, t)$
 
     >>> yc.spot(2)
-    0.012000...
+    0.012
 
     and therefor the same as the inner curve
 
@@ -245,7 +328,10 @@ class YieldCurve(_YieldCurveAdapter):
     forward spot rate $f(t, t') = \frac{r(t') - r(t)}{t' - t}$
 
     >>> yc.spot(2, 4)
-    0.015999...
+    0.016
+
+    >>> yc.spot(2, [4, 6]) == [yc.spot(2, 4), yc.spot(2, 6)]
+    True
 
 
     short rate or instantanuous forward rate $s(t) = \lim_{t' \to t} f(t, t')$
@@ -265,6 +351,22 @@ class YieldCurve(_YieldCurveAdapter):
     >>> 1 / yc.price(1, 9)
     0.852143...
 
+    or for a schedule of dates $t'$ at once
+
+    >>> yc.df(1, [5, 9]) == [yc.df(1, 5), yc.df(1, 9)]
+    True
+
+    >>> yc.zero(1, [5, 9]) == [yc.zero(1, 5), yc.zero(1, 9)]
+    True
+
+    as well as for pairs of dates $t$ and $t'$
+
+    >>> yc.df([1, 5], [5, 9]) == [yc.df(1, 5), yc.df(5, 9)]
+    True
+
+    >>> yc.zero([1, 5], [5, 9]) == [yc.zero(1, 5), yc.zero(5, 9)]
+    True
+
     zero rate $P(0, t) = \prod_{i=1}^{m * t} (1 + r(t) / m)^{m \cdot t}$
     with **compounding_frequency** $m$
 
@@ -283,6 +385,11 @@ class YieldCurve(_YieldCurveAdapter):
     >>> yc.cash(5)
     0.020301...
 
+    or for a schedule of fixing dates $t$ at once
+
+    >>> yc.cash([1, 5]) == [yc.cash(1), yc.cash(5)]
+    True
+
     swap annuity $A(t) = \sum_{i=1}^{k \cdot t} P(0, \frac{i}{k})$
     mit **swap_frequency** $k$ as fixed coupon frequency
 
@@ -326,15 +433,15 @@ class YieldCurve(_YieldCurveAdapter):
     intensity $\lambda(t) = r(t)$
 
     >>> yc.intensity(5)
-    0.015000...
+    0.015
 
     >>> yc.intensity(5, 10)
-    0.025000...
+    0.025
 
     hazard rate $h(t) = \lim_{t' \to t} \lambda(t, t')$
 
     >>> yc.hz(5)
-    0.020000...
+    0.02
 
     probability of default $pd(t, t') = 1 - P(t, t')$
 
@@ -361,6 +468,7 @@ class YieldCurve(_YieldCurveAdapter):
     0.0207810...
 
     """  # noqa 501
+    __slots__ = ()
 
     class from_prices(_YieldCurveAdapter):
         """yield curve from curve of prices
@@ -377,13 +485,21 @@ class YieldCurve(_YieldCurveAdapter):
         120.0
 
         """
+        __slots__ = ()
+
         def __call__(self, x):
-            return continuous_rate(self.curve(0) / self.curve(x), x)
+            x = x or EPS  # forward difference at origin
+            return _compounding_rate(self.curve(0) / self.curve(x), x)
 
         def price(self, x, y=None):
             if y is None:
+                if isinstance(x, ITERABLE):
+                    return type(x)(map(self.curve, x))
                 return self.curve(x)
-            return super().price(x, y)
+            if isinstance(y, ITERABLE):
+                start = self.curve(x)
+                return type(y)(self.curve(_) / start for _ in y)
+            return self.curve(y) / self.curve(x)
 
     class from_spot_rates(_YieldCurveAdapter):
         """yield curve from curve of spot rates
@@ -403,7 +519,7 @@ class YieldCurve(_YieldCurveAdapter):
         1.8221188...
 
         """
-        pass
+        __slots__ = ()
 
     class from_short_rates(_YieldCurveAdapter):
         """yield curve from curve of short rates
@@ -423,13 +539,12 @@ class YieldCurve(_YieldCurveAdapter):
         1.7332530178673953
 
         """
+        __slots__ = ()
+
         def __call__(self, x):
             if x == 0:
                 return self.curve(0)
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                r = integrate(self.curve, 0, x) / x
-            return r
+            return integrate(self.curve, 0, x) / x
 
         def short(self, x, y=None):
             return self.curve(x)
@@ -454,14 +569,21 @@ class YieldCurve(_YieldCurveAdapter):
         1.0999999999999999
 
         """
+        __slots__ = ()
+
         def __call__(self, x):
-            x = x or 1e-12
-            return continuous_rate(self.curve(x) / self.curve(0), x)
+            x = x or EPS  # forward difference at origin
+            return _compounding_rate(self.curve(x) / self.curve(0), x)
 
         def df(self, x, y=None):
             if y is None:
+                if isinstance(x, ITERABLE):
+                    return type(x)(map(self.curve, x))
                 return self.curve(x)
-            return super().df(x, y)
+            if isinstance(y, ITERABLE):
+                start = self.curve(x)
+                return type(y)(self.curve(_) / start for _ in y)
+            return self.curve(y) / self.curve(x)
 
     class from_zero_rates(_CompoundingYieldCurveAdapter):
         """yield curve from curve of zero coupon bond rates
@@ -477,21 +599,30 @@ class YieldCurve(_YieldCurveAdapter):
         >>> yc.zero(10)
         0.06
 
+        >>> yc.df(10)
+        0.549632...
+
         >>> yc.price(10)
         1.819396...
 
         """  # noqa E501
+        __slots__ = ()
+
         def __call__(self, x):
-            if x == 0:
-                return self.curve(x)
+            r = self.curve(x)
             frequency = self.frequency
-            if frequency is None:
-                return self.curve(x)
+            if x == 0 or frequency is None or frequency < 0:
+                return r
+            # continuous rate in closed form without compounding factor
             if frequency == 0:
-                df = simple_compounding(self.curve(x), x)
-                return continuous_rate(df, x)
-            df = periodic_compounding(self.curve(x), x, frequency)
-            return continuous_rate(df, x)
+                return log1p(r * x) / x
+            return log1p(r / frequency) * frequency
+
+        def df(self, x, y=None):
+            if y is None and not isinstance(x, ITERABLE):
+                # discount by zero rate without the spot rate round trip
+                return _compounding_factor(self.curve(x), x, self.frequency)
+            return super().df(x, y)
 
         def zero(self, x, y=None):
             if y is None:
@@ -500,23 +631,32 @@ class YieldCurve(_YieldCurveAdapter):
 
     class from_cash_rates(_CompoundingYieldCurveAdapter):
         """yield curve from curve of simple compound cash rates"""
+        __slots__ = ()
+
         def __call__(self, x):
             if self.frequency == 0:
-                f = simple_compounding(self.curve(x), x)
-                return continuous_rate(f, x)
+                return log1p(self.curve(x) * x) / x
 
             tenor = 1 / (self.frequency or CASH_FREQUENCY)
             n = int(x / tenor)
-            f = prod(simple_compounding(self.curve(i * tenor), tenor)
-                     for i in range(n))
-            f *= simple_compounding(self.curve(n), x - n * tenor)
-            return continuous_rate(f, x)
+            s = n * tenor
+            # sum up log growth of simple compounded periods
+            g = fsum([log1p(self.curve(i * tenor) * tenor) for i in range(n)])
+            g += log1p(self.curve(s) * (x - s))
+            return g / x
 
         def cash(self, x, y=None):
-            return self.curve(x)
+            if y is None:
+                return self.curve(x)
+            tenor = 1 / (self.frequency or CASH_FREQUENCY)
+            if isclose(y - x, tenor):
+                # quoted tenor, so no need to derive the rate
+                return self.curve(x)
+            return super().cash(x, y)
 
     class from_swap_rates(_CompoundingYieldCurveAdapter):
         """yield curve from curve of swap par rates"""
+        __slots__ = '_fit',
 
         def __call__(self, x):
             x_list = 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 20, 25, 30
@@ -550,64 +690,100 @@ class YieldCurve(_YieldCurveAdapter):
 
     class from_probs(_YieldCurveAdapter):
         """yield curve from curve of survival probabilities"""
+        __slots__ = ()
+
         def __call__(self, x):
-            return continuous_rate(self.curve(x) / self.curve(0), x)
+            x = x or EPS  # forward difference at origin
+            return _compounding_rate(self.curve(x) / self.curve(0), x)
 
         def prob(self, x, y=None):
             if y is None:
                 return self.curve(x)
-            return super().prob(x, y)
+            return self.curve(y) / self.curve(x)
+
+        def hz(self, x, y=None):
+            # differentiate log survival probabilities directly
+            x, y = x - EPS / 2, x + EPS / 2
+            return _compounding_rate(self.curve(y) / self.curve(x), y - x)
 
     class from_intensities(_YieldCurveAdapter):
         """yield curve from curve of intensities"""
-        pass
+        __slots__ = ()
 
     class from_hazard_rates(_YieldCurveAdapter):
         """yield curve from curve of hazard rates"""
+        __slots__ = ()
+
         def __call__(self, x):
-            with warnings.catch_warnings():
-                warnings.simplefilter('ignore')
-                r = integrate(self.curve, 0, x) / x
-            return r
+            if x == 0:
+                return self.curve(0)
+            return integrate(self.curve, 0, x) / x
 
         def hz(self, x, y=None):
             return self.curve(x)
 
     class from_pd(_YieldCurveAdapter):
         """yield curve from curve of probabilities of default"""
+        __slots__ = ()
+
         def __call__(self, x):
+            x = x or EPS  # forward difference at origin
             f = (1 - self.curve(x)) / (1 - self.curve(0))
-            return continuous_rate(f, x)
+            return _compounding_rate(f, x)
+
+        def prob(self, x, y=None):
+            if y is None:
+                x, y = 0, x
+            return (1 - self.curve(y)) / (1 - self.curve(x))
 
         def pd(self, x, y=None):
             if y is None:
                 return self.curve(x)
             return super().pd(x, y)
 
+        def hz(self, x, y=None):
+            # differentiate log survival probabilities directly
+            x, y = x - EPS / 2, x + EPS / 2
+            f = (1 - self.curve(y)) / (1 - self.curve(x))
+            return _compounding_rate(f, y - x)
+
     class from_marginal_probs(_YieldCurveAdapter):
         """yield curve from curve of annual survival probabilities"""
+        __slots__ = ()
+
         def __call__(self, x):
             n = int(x)
-            r = sum(continuous_rate(self.curve(i), 1) for i in range(n))
-            r += continuous_rate(self.curve(n), 1) * (x - n)
-            return r / x
+            # accumulate survival probabilities and take log only once
+            p = prod(map(self.curve, range(n)))
+            p *= self.curve(n) ** (x - n)
+            return _compounding_rate(p, x)
 
         def marginal(self, x, y=None):
             return self.curve(x)
 
     class from_marginal_pd(_YieldCurveAdapter):
         """yield curve from curve of annual probabilities of default"""
+        __slots__ = ()
+
         def __call__(self, x):
             n = int(x)
-            r = sum(continuous_rate(1 - self.curve(i), 1) for i in range(n))
-            r += continuous_rate(1 - self.curve(n), 1) * (x - n)
-            return r / x
+            # accumulate survival probabilities and take log only once
+            p = prod(1 - self.curve(i) for i in range(n))
+            p *= (1 - self.curve(n)) ** (x - n)
+            return _compounding_rate(p, x)
 
         def marginal_pd(self, x, y=None):
             return self.curve(x)
 
 
 class YieldCurveOperator:
+    __slots__ = 'curve',
+    _method = ''
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # resolve curve method name once per operator class
+        cls._method = snake_case(cls.__name__)
 
     def __init__(self, curve: YieldCurve):
         r"""Operator turning |YieldCurve| into simple callable
@@ -635,7 +811,7 @@ class YieldCurveOperator:
         >>> s = Spot(yc)
 
         >>> s(1.234)
-        0.011233999999999886
+        0.011234000000000001
 
         >>> yc.spot(1.234) == s(1.234)
         True
@@ -646,7 +822,7 @@ class YieldCurveOperator:
         >>> sh = Short(yc)
 
         >>> sh(1.234)
-        0.012468004483236131
+        0.012467999972177811
 
         >>> yc.short(1.234) == sh(1.234)
         True
@@ -727,7 +903,7 @@ class YieldCurveOperator:
         >>> it = Intensity(yc)
 
         >>> it(1.234)
-        0.011233999999999886
+        0.011234000000000001
 
         >>> yc.intensity(1.234) == it(1.234)
         True
@@ -738,7 +914,7 @@ class YieldCurveOperator:
         >>> hz = Hz(yc)
 
         >>> hz(1.234)
-        0.012468004483236131
+        0.012467999972177811
 
         >>> yc.hz(1.234) == hz(1.234)
         True
@@ -760,7 +936,7 @@ class YieldCurveOperator:
         >>> mg = Marginal(yc)
 
         >>> mg(1.234)
-        0.9866222877257945
+        0.9866222877257946
 
         >>> yc.marginal(1.234) == mg(1.234)
         True
@@ -771,7 +947,7 @@ class YieldCurveOperator:
         >>> md = MarginalPd(yc)
 
         >>> md(1.234)
-        0.013377712274205478
+        0.013377712274205367
 
         >>> yc.marginal_pd(1.234) == md(1.234)
         True
@@ -780,13 +956,14 @@ class YieldCurveOperator:
         self.curve = curve
 
     def __call__(self, x, y=None):
-        name = snake_case(self.__class__.__name__)
-        if hasattr(self.curve, name):
+        # resolve method against current curve since curve may be replaced
+        func = getattr(self.curve, self._method, None)
+        if func is not None:
             if y is None:
-                return getattr(self.curve, name)(x)
-            return getattr(self.curve, name)(x, y)
+                return func(x)
+            return func(x, y)
         msg = f"curve attribute of type {self.__class__.__name__!r} " \
-              f"object has no attribute {name!r} that can be called"
+              f"object has no attribute {self._method!r} that can be called"
         raise AttributeError(msg)
 
     def __str__(self):
@@ -798,44 +975,44 @@ class YieldCurveOperator:
 
 class Price(YieldCurveOperator):
     """price curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Spot(YieldCurveOperator):
     """spot rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Short(YieldCurveOperator):
     """spot rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 # --- interest rate operators ---
 
 class Df(YieldCurveOperator):
     """discount factor curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Zero(YieldCurveOperator):
     """zero coupon bond rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Cash(YieldCurveOperator):
     """cash rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Annuity(YieldCurveOperator):
     """swap annuity curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Swap(YieldCurveOperator):
     """swap par rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 # --- credit prob operators ---
@@ -843,29 +1020,29 @@ class Swap(YieldCurveOperator):
 
 class Prob(YieldCurveOperator):
     """survival probability curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Intensity(YieldCurveOperator):
     """intensity curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Hz(YieldCurveOperator):
     """hazard rate curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Pd(YieldCurveOperator):
     """probability of default curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class Marginal(YieldCurveOperator):
     """annual survival probability curve from |YieldCurve|"""
-    pass
+    __slots__ = ()
 
 
 class MarginalPd(YieldCurveOperator):
     """annual probability of default curve from |YieldCurve|"""
-    pass
+    __slots__ = ()